@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import argparse
 import sys
+import warnings
+
+import numpy as np
 
 from gamescape.dynamics import PayoffMatrix, CLASSIC_GAMES
 from gamescape.render import render_analysis, render_comparison
@@ -11,16 +14,22 @@ from gamescape.render import render_analysis, render_comparison
 
 def parse_matrix(s: str) -> PayoffMatrix:
     """Parse 'a,b,c,d' into a PayoffMatrix."""
-    parts = s.split(",")
-    if len(parts) != 4:
+    # fromstring tolerates a trailing separator, so count the fields up front
+    n_parts = s.count(",") + 1
+    if n_parts != 4:
         raise argparse.ArgumentTypeError(
-            f"Expected 4 comma-separated values (a,b,c,d), got {len(parts)}"
+            f"Expected 4 comma-separated values (a,b,c,d), got {n_parts}"
         )
-    try:
-        vals = [float(p.strip()) for p in parts]
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"Non-numeric value in matrix: {e}")
-    return PayoffMatrix(*vals)
+    # Older numpy only warns (and truncates) on unparsable input; newer numpy raises
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            vals = np.fromstring(s, dtype=np.float64, sep=",")
+        except (ValueError, DeprecationWarning):
+            raise argparse.ArgumentTypeError(f"Non-numeric value in matrix: {s!r}")
+    if vals.size != 4:  # an empty field, e.g. "3,0,5,"
+        raise argparse.ArgumentTypeError(f"Non-numeric value in matrix: {s!r}")
+    return PayoffMatrix(*vals.tolist())
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -65,15 +74,16 @@ def main(argv: list[str] | None = None) -> None:
 
     if args.all:
         output = render_comparison(CLASSIC_GAMES, color=not args.no_color)
-        print(output)
+        sys.stdout.write(output + "\n")
         return
 
     if args.list:
-        print("\nAvailable classic games:")
+        lines = ["", "Available classic games:"]
         for name, game in CLASSIC_GAMES.items():
             m = game.matrix
-            print(f"  {name:20s}  [{m[0,0]:.0f},{m[0,1]:.0f},{m[1,0]:.0f},{m[1,1]:.0f}]")
-        print()
+            lines.append(f"  {name:20s}  [{m[0,0]:.0f},{m[0,1]:.0f},{m[1,0]:.0f},{m[1,1]:.0f}]")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     if args.matrix:
@@ -85,7 +95,7 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(1)
 
     output = render_analysis(game, color=not args.no_color)
-    print(output)
+    sys.stdout.write(output + "\n")
 
 
 if __name__ == "__main__":
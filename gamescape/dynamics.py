@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import numpy as np
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def _matrix_of(a: float, b: float, c: float, d: float) -> np.ndarray:
+    """Shared read-only 2x2 array for a set of payoffs."""
+    # Always float64: the cache treats 1, 1.0 and True as the same key
+    arr = np.array([[a, b], [c, d]], dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+
+@dataclass(frozen=True, slots=True)
 class PayoffMatrix:
     """2x2 symmetric game payoff matrix.
 
@@ -25,7 +36,9 @@ class PayoffMatrix:
 
     @property
     def matrix(self) -> np.ndarray:
-        return np.array([[self.a, self.b], [self.c, self.d]])
+        """The payoffs as a read-only 2x2 array (cached; copy it before mutating)."""
+        # + 0.0 folds -0.0 into 0.0, which the cache would otherwise conflate
+        return _matrix_of(self.a + 0.0, self.b + 0.0, self.c + 0.0, self.d + 0.0)
 
     def fitness(self, x: float) -> tuple[float, float]:
         """Fitness of each strategy given population fraction x of strategy 0 (cooperators)."""
@@ -55,7 +68,7 @@ CLASSIC_GAMES: dict[str, PayoffMatrix] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixedPoint:
     """A fixed point of the replicator dynamics."""
 
@@ -64,6 +77,11 @@ class FixedPoint:
     label: str  # "interior", "all-C", "all-D"
 
 
+def _gains(game: PayoffMatrix) -> tuple[float, float]:
+    """Payoff differences (a - c, b - d); f0 - f1 = (a-c)x + (b-d)(1-x)."""
+    return game.a - game.c, game.b - game.d
+
+
 def replicator_dx(game: PayoffMatrix, x: float) -> float:
     """Replicator equation: dx/dt = x(1-x)(f0 - f1).
 
@@ -71,72 +89,164 @@ def replicator_dx(game: PayoffMatrix, x: float) -> float:
     """
     if x <= 0 or x >= 1:
         return 0.0
-    f0, f1 = game.fitness(x)
-    return x * (1 - x) * (f0 - f1)
+    gain_c, gain_d = _gains(game)
+    return x * (1 - x) * (gain_c * x + gain_d * (1 - x))
+
+
+def replicator_dx_array(game: PayoffMatrix, x: np.ndarray) -> np.ndarray:
+    """Vectorized replicator equation, zero outside the open interval (0, 1)."""
+    gain_c, gain_d = _gains(game)
+    inside = (x > 0) & (x < 1)
+    dx = np.zeros(np.shape(x), dtype=np.float64)
+    xi = x[inside]
+    # Non-finite payoffs give inf/nan like the scalar version, without numpy warnings
+    with np.errstate(invalid="ignore", over="ignore"):
+        dx[inside] = xi * (1 - xi) * (gain_c * xi + gain_d * (1 - xi))
+    return dx
+
+
+def _boundary_stability(gain_c: float, gain_d: float) -> tuple[bool, bool]:
+    """Stability of the (all-D, all-C) boundary fixed points."""
+    # Sign of f0 - f1 = (a-c)x + (b-d)(1-x) just inside the boundary,
+    # i.e. b-d at x=0 and a-c at x=1; if that vanishes the other term decides
+    stable_d = gain_d < 0 or (gain_d == 0 and gain_c < 0)
+    stable_c = gain_c > 0 or (gain_c == 0 and gain_d > 0)
+    return stable_d, stable_c
+
+
+def _interior_x(gain_c: float, gain_d: float) -> float | None:
+    """Location of the interior fixed point, or None if it lies outside (0, 1)."""
+    # f0(x*) = f1(x*) => x* = (d - b) / (a - b - c + d)
+    denom = gain_c - gain_d
+    if abs(denom) > 1e-12:
+        x_star = -gain_d / denom
+        if 0 < x_star < 1:
+            return x_star
+    return None
 
 
-def find_fixed_points(game: PayoffMatrix) -> list[FixedPoint]:
-    """Find all fixed points of the replicator dynamics."""
-    points: list[FixedPoint] = []
+@lru_cache(maxsize=64)
+def _fixed_points(game: PayoffMatrix) -> tuple[FixedPoint, ...]:
+    """Memoized, immutable backing store for find_fixed_points."""
+    gain_c, gain_d = _gains(game)
 
     # Boundary fixed points are always present
-    # Stability: check sign of dx/dt near the boundary
-    eps = 1e-8
-    dx_near_0 = replicator_dx(game, eps)
-    dx_near_1 = replicator_dx(game, 1 - eps)
+    stable_d, stable_c = _boundary_stability(gain_c, gain_d)
+    all_d = FixedPoint(x=0.0, stable=stable_d, label="all-D")
+    all_c = FixedPoint(x=1.0, stable=stable_c, label="all-C")
 
-    points.append(FixedPoint(x=0.0, stable=dx_near_0 < 0, label="all-D"))
-    points.append(FixedPoint(x=1.0, stable=dx_near_1 > 0, label="all-C"))
+    x_star = _interior_x(gain_c, gain_d)
+    if x_star is None:
+        return (all_d, all_c)
 
-    # Interior fixed point: f0(x*) = f1(x*) => x* = (d - b) / (a - b - c + d)
-    denom = game.a - game.b - game.c + game.d
-    if abs(denom) > 1e-12:
-        x_star = (game.d - game.b) / denom
-        if 0 < x_star < 1:
-            # Stability: check derivative of dx/dt at x*
-            # d(dx/dt)/dx at interior = (1-2x*)(f0-f1) + x*(1-x*)(f0'-f1')
-            # At fixed point f0=f1, so first term vanishes
-            # f0' - f1' = a - b - c + d = denom
-            deriv = x_star * (1 - x_star) * denom
-            # But we also need the (1-2x) term evaluated properly
-            # Actually: d/dx[x(1-x)(f0-f1)] at f0=f1:
-            # = (1-2x*)*0 + x*(1-x*) * d(f0-f1)/dx
-            # d(f0-f1)/dx = (a-b) - (c-d) = a - b - c + d = denom
-            stable = deriv < 0
-            points.append(FixedPoint(x=x_star, stable=stable, label="interior"))
-
-    return sorted(points, key=lambda p: p.x)
-
-
-def trajectory(game: PayoffMatrix, x0: float, dt: float = 0.01, steps: int = 2000) -> list[float]:
-    """Simulate replicator dynamics from initial condition x0."""
-    xs = [x0]
-    x = x0
-    for _ in range(steps):
-        dx = replicator_dx(game, x)
-        x = x + dt * dx
-        x = max(0.0, min(1.0, x))
-        xs.append(x)
+    # Stability: check derivative of dx/dt at x*
+    # d(dx/dt)/dx at interior = (1-2x*)(f0-f1) + x*(1-x*)(f0'-f1')
+    # At fixed point f0=f1, so first term vanishes
+    # d(f0-f1)/dx = (a-b) - (c-d) = a - b - c + d = denom
+    denom = gain_c - gain_d
+    deriv = x_star * (1 - x_star) * denom
+    interior = FixedPoint(x=x_star, stable=deriv < 0, label="interior")
+    # 0 < x* < 1, so the interior point always sits between the boundaries
+    return (all_d, interior, all_c)
+
+
+def find_fixed_points(game: PayoffMatrix) -> list[FixedPoint]:
+    """Find all fixed points of the replicator dynamics, ordered by x."""
+    # Fresh list per call so callers can't corrupt the cached result
+    return list(_fixed_points(game))
+
+
+_METHODS = ("euler", "midpoint")
+
+
+def _check_method(method: str) -> bool:
+    """Validate an integrator name; returns True for the midpoint (RK2) rule."""
+    if method not in _METHODS:
+        raise ValueError(f"Unknown integration method {method!r}, expected one of {_METHODS}")
+    return method == "midpoint"
+
+
+def trajectory(
+    game: PayoffMatrix, x0: float, dt: float = 0.01, steps: int = 2000,
+    method: str = "euler",
+) -> np.ndarray:
+    """Simulate replicator dynamics from initial condition x0.
+
+    ``method`` is ``"euler"`` (first order) or ``"midpoint"`` (second order, so
+    far fewer, larger steps reach the same accuracy). Returns the visited states,
+    stopping early once the flow has converged.
+    """
+    midpoint = _check_method(method)
+    gain_c, gain_d = _gains(game)
+    xs = np.empty(steps + 1, dtype=np.float64)
+    xs[0] = x0
+    x = float(x0)
+    n = 1
+    for i in range(steps):
+        dx = 0.0 if x <= 0 or x >= 1 else x * (1 - x) * (gain_c * x + gain_d * (1 - x))
+        if midpoint:
+            xm = x + 0.5 * dt * dx
+            dx = 0.0 if xm <= 0 or xm >= 1 else xm * (1 - xm) * (gain_c * xm + gain_d * (1 - xm))
+        x += dt * dx
+        if x < 0.0:
+            x = 0.0
+        elif x > 1.0:
+            x = 1.0
+        xs[i + 1] = x
+        n = i + 2
         if abs(dx) < 1e-10:
             break
-    return xs
+    return xs[:n]
+
+
+def batch_trajectories(
+    game: PayoffMatrix, x0_values: Sequence[float], dt: float = 0.01, steps: int = 2000,
+    method: str = "euler",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Simulate replicator dynamics from several initial conditions at once.
+
+    Returns ``(xs, lengths)`` where ``xs`` has shape ``(steps + 1, len(x0_values))``
+    and ``xs[:lengths[k], k]`` equals ``trajectory(game, x0_values[k], dt, steps, method)``.
+    """
+    midpoint = _check_method(method)
+    x = np.array(x0_values, dtype=np.float64)
+    xs = np.empty((steps + 1, x.size), dtype=np.float64)
+    xs[0] = x
+    lengths = np.full(x.size, steps + 1, dtype=np.intp)
+    running = np.ones(x.size, dtype=bool)
+    last = 0
+    for i in range(steps):
+        dx = replicator_dx_array(game, x)
+        if midpoint:
+            dx = replicator_dx_array(game, x + 0.5 * dt * dx)
+        x = np.clip(x + dt * dx, 0.0, 1.0)
+        xs[i + 1] = x
+        last = i + 1
+        converged = running & (np.abs(dx) < 1e-10)
+        if converged.any():
+            lengths[converged] = i + 2
+            running &= ~converged
+            if not running.any():
+                break
+    return xs[: last + 1], lengths
+
+
+# (all-C stable, all-D stable, interior exists, interior stable) -> class
+_CLASSIFICATION: dict[tuple[bool, bool, bool, bool], str] = {
+    (True, False, False, False): "dominant-cooperate",
+    (False, True, False, False): "dominant-defect",
+    (True, True, True, False): "coordination",
+    (False, False, True, True): "coexistence",
+    (True, True, False, False): "bistable",
+}
 
 
+@lru_cache(maxsize=64)
 def classify_game(game: PayoffMatrix) -> str:
     """Classify a 2x2 symmetric game by its dynamics."""
-    fps = find_fixed_points(game)
-    interior = [fp for fp in fps if fp.label == "interior"]
-    all_c = next(fp for fp in fps if fp.label == "all-C")
-    all_d = next(fp for fp in fps if fp.label == "all-D")
-
-    if all_c.stable and not all_d.stable and not interior:
-        return "dominant-cooperate"
-    if all_d.stable and not all_c.stable and not interior:
-        return "dominant-defect"
-    if all_c.stable and all_d.stable and interior and not interior[0].stable:
-        return "coordination"
-    if not all_c.stable and not all_d.stable and interior and interior[0].stable:
-        return "coexistence"
-    if all_c.stable and all_d.stable and not interior:
-        return "bistable"
-    return "other"
+    gain_c, gain_d = _gains(game)
+    stable_d, stable_c = _boundary_stability(gain_c, gain_d)
+    has_interior = _interior_x(gain_c, gain_d) is not None
+    # The interior point is stable iff d(f0-f1)/dx = a - b - c + d < 0
+    interior_stable = has_interior and gain_c - gain_d < 0
+    return _CLASSIFICATION.get((stable_c, stable_d, has_interior, interior_stable), "other")
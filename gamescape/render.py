@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Sequence
+from functools import lru_cache, wraps
+
+import numpy as np
+
 from gamescape.dynamics import (
     PayoffMatrix,
     FixedPoint,
     find_fixed_points,
-    replicator_dx,
-    trajectory,
+    replicator_dx_array,
+    batch_trajectories,
     classify_game,
 )
 
@@ -22,69 +28,124 @@ BLUE = "\033[34m"
 MAGENTA = "\033[35m"
 CYAN = "\033[36m"
 
+# Renderers always emit color; plain output is produced by stripping the escapes
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+# Simulated time span of the trajectory plots
+_PLOT_HORIZON = 2.0
+
+# Flow-line cell for dx/dt < 0, == 0, > 0 (indexed by sign + 1)
+_FLOW_ARROWS = (f"{MAGENTA}<{RESET}", f"{DIM}.{RESET}", f"{CYAN}>{RESET}")
+# Flow-line cell for an unstable / stable fixed point (indexed by stability)
+_FLOW_FIXED = (f"{RED}{BOLD}o{RESET}", f"{GREEN}{BOLD}@{RESET}")
+
+# Trajectory plot markers and their colors (full plot, then compact cards)
+_DEFAULT_X0S = (0.1, 0.3, 0.5, 0.7, 0.9)
+_SYMBOLS = ("*", "+", "~", "#", "^", "=", "%", "&")
+_COLORS = (CYAN, GREEN, YELLOW, MAGENTA, RED, BLUE, CYAN, GREEN)
+_COMPACT_SYMBOLS = (".", ":", "~", "#", "^")
+_COMPACT_COLORS = (CYAN, GREEN, YELLOW, MAGENTA, RED)
+
+
+def _color_table(symbols: Sequence[str], colors: Sequence[str]) -> dict[int, str]:
+    """str.translate table wrapping each plot symbol in its trajectory color."""
+    return str.maketrans(
+        {sym: f"{colors[i % len(colors)]}{sym}{RESET}" for i, sym in enumerate(symbols)}
+    )
+
+
+def _legend(x0_values: Sequence[float]) -> str:
+    """Legend line pairing each trajectory marker with its initial condition."""
+    parts = []
+    for idx, x0 in enumerate(x0_values):
+        sym = _SYMBOLS[idx % len(_SYMBOLS)]
+        parts.append(f"{_COLORS[idx % len(_COLORS)]}{sym}{RESET} x0={x0:.1f}")
+    return "  " + "  ".join(parts)
+
+
+def _cache_by_payoffs(maxsize: int) -> Callable:
+    """lru_cache for ``fn(game, color)`` renderers that print the raw payoffs.
+
+    Equal games can still format differently (0.0 vs -0.0), so the cache key
+    also includes the game's repr.
+    """
+    def decorator(fn: Callable[[PayoffMatrix, bool], str]) -> Callable[..., str]:
+        @lru_cache(maxsize=maxsize)
+        def cached(key: str, game: PayoffMatrix, color: bool) -> str:
+            return fn(game, color)
 
-def _arrow(dx: float) -> str:
-    """Map a derivative to an arrow character."""
-    if dx > 0.1:
-        return ">>>"
-    elif dx > 0.01:
-        return ">>"
-    elif dx > 0.001:
-        return ">"
-    elif dx > 0:
-        return ">"
-    elif dx < -0.1:
-        return "<<<"
-    elif dx < -0.01:
-        return "<<"
-    elif dx < -0.001:
-        return "<"
-    elif dx < 0:
-        return "<"
-    return "."
+        @wraps(fn)
+        def wrapper(game: PayoffMatrix, color: bool = True) -> str:
+            return cached(repr(game), game, color)
 
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
 
+
+def _strip_ansi(s: str) -> str:
+    """Remove ANSI escape codes to get visible length."""
+    return _ANSI_RE.sub("", s)
+
+
+# Per-symbol colorizing tables for str.translate (O(1) lookup per character)
+_SYMBOL_COLORS = _color_table(_SYMBOLS, _COLORS)
+_COMPACT_SYMBOL_COLORS = _color_table(_COMPACT_SYMBOLS, _COMPACT_COLORS)
+_DEFAULT_LEGEND = _legend(_DEFAULT_X0S)
+
+
+def _trajectory_grid(
+    game: PayoffMatrix, x0_values: Sequence[float], width: int, height: int,
+    symbols: Sequence[str],
+) -> list[str]:
+    """Integrate all trajectories together and scatter them onto a character grid.
+
+    Returns the grid as one plain ASCII string per row, top row first.
+    """
+    # Second-order steps are accurate enough to take just one step per column
+    xs, lengths = batch_trajectories(
+        game, x0_values, dt=_PLOT_HORIZON / width, steps=width, method="midpoint",
+    )
+    max_t = int(lengths.max())
+
+    grid = np.full((height, width), ord(" "), dtype=np.uint8)
+    sym_ords = np.array([ord(sym) for sym in symbols], dtype=np.uint8)
+    t_idx = np.arange(max_t)
+    cols = (t_idx / max_t * (width - 1)).astype(int).clip(0, width - 1)
+    rows = (height - 1 - (xs[:max_t] * (height - 1)).astype(int)).clip(0, height - 1)
+    for idx, n in enumerate(lengths):
+        grid[rows[:n, idx], cols[:n]] = sym_ords[idx % len(symbols)]
+    return [row.tobytes().decode("ascii") for row in grid]
+
+
+@lru_cache(maxsize=64)
 def render_flow_line(game: PayoffMatrix, width: int = 60, color: bool = True) -> str:
     """Render a 1D flow line showing direction of replicator dynamics.
 
     x=0 (all-D) on left, x=1 (all-C) on right.
     """
     fps = find_fixed_points(game)
-    cells: list[str] = []
+    xs = np.arange(width) / (width - 1)
+    dxs = replicator_dx_array(game, xs)
 
-    for i in range(width):
-        x = i / (width - 1)
-        dx = replicator_dx(game, x)
-
-        # Check if near a fixed point
-        near_fp = None
-        for fp in fps:
-            if abs(x - fp.x) < 0.5 / width:
-                near_fp = fp
-                break
-
-        if near_fp is not None:
-            if color:
-                if near_fp.stable:
-                    cells.append(f"{GREEN}{BOLD}@{RESET}")
-                else:
-                    cells.append(f"{RED}{BOLD}o{RESET}")
-            else:
-                cells.append("@" if near_fp.stable else "o")
+    # Index of the first fixed point each column sits on, or -1
+    fp_xs = np.array([fp.x for fp in fps])
+    near = np.abs(xs[:, None] - fp_xs[None, :]) < 0.5 / width
+    near_idx = np.where(near.any(axis=1), near.argmax(axis=1), -1)
+
+    # NaN (from non-finite payoffs) compares false both ways and maps to "."
+    signs = (dxs > 0).astype(int) - (dxs < 0) + 1
+
+    cells: list[str] = []
+    for sign, fp_idx in zip(signs.tolist(), near_idx.tolist()):
+        if fp_idx >= 0:
+            cells.append(_FLOW_FIXED[fps[fp_idx].stable])
         else:
-            arrow = _arrow(dx)
-            if color:
-                if dx > 0:
-                    cells.append(f"{CYAN}{arrow[-1]}{RESET}")
-                elif dx < 0:
-                    cells.append(f"{MAGENTA}{arrow[-1]}{RESET}")
-                else:
-                    cells.append(f"{DIM}.{RESET}")
-            else:
-                cells.append(arrow[-1])
+            cells.append(_FLOW_ARROWS[sign])
 
-    line = "".join(cells)
-    return f"  all-D |{line}| all-C"
+    out = f"  all-D |{''.join(cells)}| all-C"
+    return out if color else _strip_ansi(out)
 
 
 def render_trajectory_plot(
@@ -93,23 +154,12 @@ def render_trajectory_plot(
 ) -> str:
     """Render x(t) trajectories as an ASCII plot."""
     if x0_values is None:
-        x0_values = [0.1, 0.3, 0.5, 0.7, 0.9]
-
-    trajectories = [trajectory(game, x0, steps=200) for x0 in x0_values]
-    max_t = max(len(t) for t in trajectories)
-
-    # Build the grid
-    grid = [[" " for _ in range(width)] for _ in range(height)]
-    symbols = ["*", "+", "~", "#", "^", "=", "%", "&"]
+        x0_values = _DEFAULT_X0S
+        legend = _DEFAULT_LEGEND
+    else:
+        legend = _legend(x0_values)
 
-    for idx, traj in enumerate(trajectories):
-        sym = symbols[idx % len(symbols)]
-        for t_idx, x_val in enumerate(traj):
-            col = int(t_idx / max_t * (width - 1))
-            row = height - 1 - int(x_val * (height - 1))
-            row = max(0, min(height - 1, row))
-            col = max(0, min(width - 1, col))
-            grid[row][col] = sym
+    grid_rows = _trajectory_grid(game, x0_values, width, height, _SYMBOLS)
 
     lines: list[str] = []
     lines.append(f"  x(t) trajectories from {len(x0_values)} initial conditions")
@@ -117,58 +167,31 @@ def render_trajectory_plot(
 
     for r in range(height):
         x_label = f"{1.0 - r / (height - 1):.1f}"
-        row_str = "".join(grid[r])
-        if color:
-            # Colorize each trajectory symbol
-            colored = []
-            colors = [CYAN, GREEN, YELLOW, MAGENTA, RED, BLUE, CYAN, GREEN]
-            for ch in row_str:
-                if ch in symbols:
-                    c = colors[symbols.index(ch) % len(colors)]
-                    colored.append(f"{c}{ch}{RESET}")
-                else:
-                    colored.append(ch)
-            row_str = "".join(colored)
-        lines.append(f"  {x_label:>4}|{row_str}|")
+        # Colorize each trajectory symbol in a single pass per row
+        lines.append(f"  {x_label:>4}|{grid_rows[r].translate(_SYMBOL_COLORS)}|")
 
     lines.append(f"  {'':>4} {'':─<{width}}")
     lines.append(f"  {'':>4} t=0{'':>{width - 6}}t=T")
 
     # Legend
     lines.append("")
-    legend_parts = []
-    for idx, x0 in enumerate(x0_values):
-        sym = symbols[idx % len(symbols)]
-        if color:
-            c = [CYAN, GREEN, YELLOW, MAGENTA, RED, BLUE, CYAN, GREEN][idx % 8]
-            legend_parts.append(f"{c}{sym}{RESET} x0={x0:.1f}")
-        else:
-            legend_parts.append(f"{sym} x0={x0:.1f}")
-    lines.append("  " + "  ".join(legend_parts))
+    lines.append(legend)
 
-    return "\n".join(lines)
+    out = "\n".join(lines)
+    return out if color else _strip_ansi(out)
 
 
+@_cache_by_payoffs(maxsize=64)
 def render_payoff_table(game: PayoffMatrix, color: bool = True) -> str:
     """Render the payoff matrix as a formatted table."""
     header = f"{'':>12}{'Cooperate':>12}{'Defect':>12}"
     row_c = f"{'Cooperate':>12}"
     row_d = f"{'Defect':>12}"
+    row_c += f"{GREEN}{game.a:>12.1f}{RESET}{RED}{game.b:>12.1f}{RESET}"
+    row_d += f"{YELLOW}{game.c:>12.1f}{RESET}{BLUE}{game.d:>12.1f}{RESET}"
 
-    if color:
-        row_c += f"{GREEN}{game.a:>12.1f}{RESET}{RED}{game.b:>12.1f}{RESET}"
-        row_d += f"{YELLOW}{game.c:>12.1f}{RESET}{BLUE}{game.d:>12.1f}{RESET}"
-    else:
-        row_c += f"{game.a:>12.1f}{game.b:>12.1f}"
-        row_d += f"{game.c:>12.1f}{game.d:>12.1f}"
-
-    return f"  {header}\n  {row_c}\n  {row_d}"
-
-
-def _strip_ansi(s: str) -> str:
-    """Remove ANSI escape codes to get visible length."""
-    import re
-    return re.sub(r"\033\[[0-9;]*m", "", s)
+    out = f"  {header}\n  {row_c}\n  {row_d}"
+    return out if color else _strip_ansi(out)
 
 
 def _visible_len(s: str) -> str:
@@ -194,79 +217,42 @@ def render_compact(name: str, game: PayoffMatrix, flow_width: int = 30,
     lines: list[str] = []
 
     # Title bar
-    if color:
-        lines.append(f"{BOLD}{CYAN}{'=' * 34}{RESET}")
-        lines.append(f"{BOLD}{CYAN} {name:^32s} {RESET}")
-        lines.append(f"{BOLD}{CYAN}{'=' * 34}{RESET}")
-    else:
-        lines.append("=" * 34)
-        lines.append(f" {name:^32s} ")
-        lines.append("=" * 34)
+    lines.append(f"{BOLD}{CYAN}{'=' * 34}{RESET}")
+    lines.append(f"{BOLD}{CYAN} {name:^32s} {RESET}")
+    lines.append(f"{BOLD}{CYAN}{'=' * 34}{RESET}")
 
     # Payoff matrix (compact)
     lines.append(f"       {'C':>6s}{'D':>6s}")
-    if color:
-        lines.append(f"   C  {GREEN}{game.a:>6.0f}{RESET}{RED}{game.b:>6.0f}{RESET}")
-        lines.append(f"   D  {YELLOW}{game.c:>6.0f}{RESET}{BLUE}{game.d:>6.0f}{RESET}")
-    else:
-        lines.append(f"   C  {game.a:>6.0f}{game.b:>6.0f}")
-        lines.append(f"   D  {game.c:>6.0f}{game.d:>6.0f}")
+    lines.append(f"   C  {GREEN}{game.a:>6.0f}{RESET}{RED}{game.b:>6.0f}{RESET}")
+    lines.append(f"   D  {YELLOW}{game.c:>6.0f}{RESET}{BLUE}{game.d:>6.0f}{RESET}")
 
     # Classification
-    if color:
-        lines.append(f" {BOLD}Type:{RESET} {YELLOW}{classification}{RESET}")
-    else:
-        lines.append(f" Type: {classification}")
+    lines.append(f" {BOLD}Type:{RESET} {YELLOW}{classification}{RESET}")
 
     # Fixed points
     for fp in fps:
         marker = "@" if fp.stable else "o"
         stab = "stable" if fp.stable else "unstable"
-        if color:
-            sc = GREEN if fp.stable else RED
-            lines.append(f"  {sc}{marker}{RESET} x={fp.x:.3f} {fp.label} {sc}{stab}{RESET}")
-        else:
-            lines.append(f"  {marker} x={fp.x:.3f} {fp.label} {stab}")
+        sc = GREEN if fp.stable else RED
+        lines.append(f"  {sc}{marker}{RESET} x={fp.x:.3f} {fp.label} {sc}{stab}{RESET}")
 
     # Flow line
-    flow = render_flow_line(game, width=flow_width, color=color)
+    flow = render_flow_line(game, width=flow_width)
     # Strip the "  all-D |..| all-C" wrapper for compact version
     lines.append(f" D|{flow.split('|')[1]}|C")
 
     # Mini trajectory plot
-    x0_values = [0.1, 0.3, 0.5, 0.7, 0.9]
-    trajectories = [trajectory(game, x0, steps=200) for x0 in x0_values]
-    max_t = max(len(t) for t in trajectories)
-    symbols = [".", ":", "~", "#", "^"]
-
-    grid = [[" " for _ in range(traj_width)] for _ in range(traj_height)]
-    for idx, traj in enumerate(trajectories):
-        sym = symbols[idx % len(symbols)]
-        for t_idx, x_val in enumerate(traj):
-            col = int(t_idx / max_t * (traj_width - 1))
-            row = traj_height - 1 - int(x_val * (traj_height - 1))
-            row = max(0, min(traj_height - 1, row))
-            col = max(0, min(traj_width - 1, col))
-            grid[row][col] = sym
-
-    traj_colors = [CYAN, GREEN, YELLOW, MAGENTA, RED]
+    grid_rows = _trajectory_grid(
+        game, _DEFAULT_X0S, traj_width, traj_height, _COMPACT_SYMBOLS,
+    )
+
     lines.append(f" {'─' * (traj_width + 2)}")
     for r in range(traj_height):
         label = f"{1.0 - r / (traj_height - 1):.1f}" if r % 3 == 0 else "   "
-        row_str = "".join(grid[r])
-        if color:
-            colored = []
-            for ch in row_str:
-                if ch in symbols:
-                    c = traj_colors[symbols.index(ch) % len(traj_colors)]
-                    colored.append(f"{c}{ch}{RESET}")
-                else:
-                    colored.append(ch)
-            row_str = "".join(colored)
-        lines.append(f"{label}|{row_str}|")
+        lines.append(f"{label}|{grid_rows[r].translate(_COMPACT_SYMBOL_COLORS)}|")
     lines.append(f" {'─' * (traj_width + 2)}")
 
-    return lines
+    return lines if color else [_strip_ansi(line) for line in lines]
 
 
 def render_comparison(games: dict[str, PayoffMatrix], color: bool = True) -> str:
@@ -274,7 +260,7 @@ def render_comparison(games: dict[str, PayoffMatrix], color: bool = True) -> str
     # Render each game as a list of lines
     columns: list[list[str]] = []
     for name, game in games.items():
-        col = render_compact(name, game, color=color)
+        col = render_compact(name, game)
         columns.append(col)
 
     # Pad all columns to same height
@@ -300,79 +286,57 @@ def render_comparison(games: dict[str, PayoffMatrix], color: bool = True) -> str
         output_lines.append(sep.join(parts))
 
     # Header
-    header = ""
-    if color:
-        header = f"\n{BOLD}  Evolutionary Game Theory — All Classic 2x2 Games{RESET}\n"
-    else:
-        header = "\n  Evolutionary Game Theory — All Classic 2x2 Games\n"
+    header = f"\n{BOLD}  Evolutionary Game Theory — All Classic 2x2 Games{RESET}\n"
 
-    return header + "\n".join(output_lines) + "\n"
+    out = header + "\n".join(output_lines) + "\n"
+    return out if color else _strip_ansi(out)
 
 
+@_cache_by_payoffs(maxsize=32)
 def render_analysis(game: PayoffMatrix, color: bool = True) -> str:
-    """Full analysis output."""
+    """Full analysis output.
+
+    Memoized on ``(game, color)``; the output is fully determined by them.
+    """
     fps = find_fixed_points(game)
     classification = classify_game(game)
 
     lines: list[str] = []
 
     # Title
-    if color:
-        lines.append(f"\n{BOLD}  Game Analysis{RESET}")
-    else:
-        lines.append("\n  Game Analysis")
+    lines.append(f"\n{BOLD}  Game Analysis{RESET}")
     lines.append("  " + "=" * 40)
 
     # Payoff matrix
     lines.append("")
-    if color:
-        lines.append(f"  {BOLD}Payoff Matrix:{RESET}")
-    else:
-        lines.append("  Payoff Matrix:")
-    lines.append(render_payoff_table(game, color))
+    lines.append(f"  {BOLD}Payoff Matrix:{RESET}")
+    lines.append(render_payoff_table(game))
 
     # Classification
     lines.append("")
-    if color:
-        lines.append(f"  {BOLD}Classification:{RESET} {CYAN}{classification}{RESET}")
-    else:
-        lines.append(f"  Classification: {classification}")
+    lines.append(f"  {BOLD}Classification:{RESET} {CYAN}{classification}{RESET}")
 
     # Fixed points
     lines.append("")
-    if color:
-        lines.append(f"  {BOLD}Fixed Points:{RESET}")
-    else:
-        lines.append("  Fixed Points:")
+    lines.append(f"  {BOLD}Fixed Points:{RESET}")
     for fp in fps:
         stability = "stable" if fp.stable else "unstable"
-        if color:
-            s_color = GREEN if fp.stable else RED
-            lines.append(
-                f"    {s_color}{'@' if fp.stable else 'o'}{RESET} "
-                f"x={fp.x:.4f} ({fp.label}, {s_color}{stability}{RESET})"
-            )
-        else:
-            lines.append(
-                f"    {'@' if fp.stable else 'o'} "
-                f"x={fp.x:.4f} ({fp.label}, {stability})"
-            )
+        s_color = GREEN if fp.stable else RED
+        lines.append(
+            f"    {s_color}{'@' if fp.stable else 'o'}{RESET} "
+            f"x={fp.x:.4f} ({fp.label}, {s_color}{stability}{RESET})"
+        )
 
     # Flow line
     lines.append("")
-    if color:
-        lines.append(f"  {BOLD}Phase Flow:{RESET}")
-    else:
-        lines.append("  Phase Flow:")
-    lines.append(render_flow_line(game, color=color))
+    lines.append(f"  {BOLD}Phase Flow:{RESET}")
+    lines.append(render_flow_line(game))
 
     # Trajectory plot
     lines.append("")
-    if color:
-        lines.append(f"  {BOLD}Trajectories:{RESET}")
-    else:
-        lines.append("  Trajectories:")
-    lines.append(render_trajectory_plot(game, color=color))
+    lines.append(f"  {BOLD}Trajectories:{RESET}")
+    lines.append(render_trajectory_plot(game))
 
     lines.append("")
-    return "\n".join(lines)
+    out = "\n".join(lines)
+    return out if color else _strip_ansi(out)
@@ -1,5 +1,7 @@
 """Tests for CLI entry point."""
 
+import argparse
+
 import pytest
 from gamescape.cli import main, parse_matrix
 from gamescape.dynamics import PayoffMatrix
@@ -22,6 +24,14 @@ class TestParseMatrix:
         with pytest.raises(Exception):
             parse_matrix("3,0,5")
 
+    def test_trailing_comma(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_matrix("3,0,5,1,")
+
+    def test_non_numeric(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_matrix("3,x,5,1")
+
 
 class TestCLI:
     def test_list(self, capsys):
@@ -1,11 +1,14 @@
 """Tests for replicator dynamics and fixed-point analysis."""
 
+import numpy as np
 import pytest
 from gamescape.dynamics import (
     PayoffMatrix,
     replicator_dx,
+    replicator_dx_array,
     find_fixed_points,
     trajectory,
+    batch_trajectories,
     classify_game,
     PRISONERS_DILEMMA,
     STAG_HUNT,
@@ -28,6 +31,22 @@ class TestPayoffMatrix:
         # 0.5*1.5 + 0.5*3.0 = 2.25
         assert avg == pytest.approx(2.25)
 
+    def test_matrix_cached_read_only(self):
+        game = PayoffMatrix(a=3, b=0, c=5, d=1)
+        m = game.matrix
+        assert m is game.matrix
+        assert m[1, 0] == 5
+        with pytest.raises(ValueError):
+            m[0, 0] = 1
+
+    def test_matrix_dtype_independent_of_cache(self):
+        assert PayoffMatrix(3, 0, 5, 1).matrix.dtype == np.float64
+        assert PayoffMatrix(3.0, 0.0, 5.0, 1.0).matrix.dtype == np.float64
+
+    def test_matrix_signed_zero_not_leaked(self):
+        PayoffMatrix(-0.0, 1, 2, 3).matrix
+        assert str(PayoffMatrix(0.0, 1, 2, 3).matrix[0, 0]) == "0.0"
+
 
 class TestReplicatorDx:
     def test_boundary_zero(self):
@@ -45,6 +64,13 @@ class TestReplicatorDx:
         for x in [0.1, 0.3, 0.5, 0.7, 0.9]:
             assert replicator_dx(HARMONY, x) > 0
 
+    def test_array_matches_scalar(self):
+        xs = np.linspace(0, 1, 11)
+        dxs = replicator_dx_array(HAWK_DOVE, xs)
+        assert dxs[0] == dxs[-1] == 0.0
+        for x, dx in zip(xs, dxs):
+            assert dx == pytest.approx(replicator_dx(HAWK_DOVE, x))
+
 
 class TestFixedPoints:
     def test_pd_fixed_points(self):
@@ -64,6 +90,16 @@ class TestFixedPoints:
         assert interior[0].stable is True
         assert 0 < interior[0].x < 1
 
+    def test_mutating_result_does_not_affect_cache(self):
+        fps = find_fixed_points(HAWK_DOVE)
+        fps.clear()
+        assert len(find_fixed_points(HAWK_DOVE)) == 3
+
+    def test_sorted_by_x(self):
+        for game in [PRISONERS_DILEMMA, STAG_HUNT, HAWK_DOVE, COORDINATION, HARMONY]:
+            xs = [fp.x for fp in find_fixed_points(game)]
+            assert xs == sorted(xs)
+
     def test_stag_hunt_bistable(self):
         fps = find_fixed_points(STAG_HUNT)
         labels = {fp.label: fp for fp in fps}
@@ -73,6 +109,13 @@ class TestFixedPoints:
         assert len(interior) == 1
         assert interior[0].stable is False
 
+    def test_boundary_stability_degenerate(self):
+        """With b == d the x-linear term decides stability of all-D."""
+        fps = find_fixed_points(PayoffMatrix(a=1, b=2, c=3, d=2))
+        labels = {fp.label: fp for fp in fps}
+        assert labels["all-D"].stable is True
+        assert labels["all-C"].stable is False
+
     def test_harmony_all_c_stable(self):
         fps = find_fixed_points(HARMONY)
         labels = {fp.label: fp for fp in fps}
@@ -94,6 +137,33 @@ class TestTrajectory:
             traj = trajectory(game, 0.5)
             assert all(0 <= x <= 1 for x in traj)
 
+    def test_stops_early_at_fixed_point(self):
+        traj = trajectory(PRISONERS_DILEMMA, 0.0, steps=100)
+        assert len(traj) == 2
+        assert traj[0] == traj[1] == 0.0
+
+    def test_midpoint_converges_with_fewer_steps(self):
+        traj = trajectory(HARMONY, 0.5, dt=0.1, steps=500, method="midpoint")
+        assert traj[-1] > 0.99
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            trajectory(HARMONY, 0.5, method="rk4")
+
+    def test_batch_matches_single(self):
+        x0s = [0.0, 0.1, 0.5, 0.9, 1.0]
+        for game in [PRISONERS_DILEMMA, STAG_HUNT, HAWK_DOVE]:
+            xs, lengths = batch_trajectories(game, x0s, steps=300)
+            for k, x0 in enumerate(x0s):
+                assert list(xs[:lengths[k], k]) == list(trajectory(game, x0, steps=300))
+
+    def test_batch_matches_single_midpoint(self):
+        x0s = [0.1, 0.5, 0.9]
+        xs, lengths = batch_trajectories(HAWK_DOVE, x0s, dt=0.05, steps=100, method="midpoint")
+        for k, x0 in enumerate(x0s):
+            expected = trajectory(HAWK_DOVE, x0, dt=0.05, steps=100, method="midpoint")
+            assert list(xs[:lengths[k], k]) == list(expected)
+
 
 class TestClassification:
     def test_pd_is_dominant_defect(self):
@@ -107,3 +177,6 @@ class TestClassification:
 
     def test_stag_hunt_is_coordination(self):
         assert classify_game(STAG_HUNT) == "coordination"
+
+    def test_neutral_is_other(self):
+        assert classify_game(PayoffMatrix(a=1, b=1, c=1, d=1)) == "other"
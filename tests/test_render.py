@@ -1,7 +1,16 @@
 """Tests for ASCII rendering."""
 
-from gamescape.dynamics import PRISONERS_DILEMMA, HAWK_DOVE
-from gamescape.render import render_flow_line, render_analysis, render_payoff_table
+import math
+
+import pytest
+
+from gamescape.dynamics import PayoffMatrix, PRISONERS_DILEMMA, HAWK_DOVE
+from gamescape.render import (
+    render_flow_line,
+    render_analysis,
+    render_payoff_table,
+    render_trajectory_plot,
+)
 
 
 class TestRenderFlowLine:
@@ -15,6 +24,28 @@ class TestRenderFlowLine:
         line = render_flow_line(HAWK_DOVE, color=False)
         assert "@" in line  # stable interior fixed point
 
+    @pytest.mark.filterwarnings("error")
+    def test_infinite_payoffs_warn_free(self):
+        for payoffs in [(math.inf, 1, 2, 3), (0, math.inf, 0, 0), (1e308, 0, -1e308, 0)]:
+            line = render_flow_line(PayoffMatrix(*payoffs), color=False)
+            assert "all-D" in line
+
+    def test_nan_payoff(self):
+        line = render_flow_line(PayoffMatrix(float("nan"), 1, 2, 3), color=False)
+        assert "." in line
+
+
+class TestRenderTrajectoryPlot:
+    def test_default_legend(self):
+        plot = render_trajectory_plot(HAWK_DOVE, color=False)
+        assert "from 5 initial conditions" in plot
+        assert plot.endswith("^ x0=0.9")
+
+    def test_custom_initial_conditions(self):
+        plot = render_trajectory_plot(HAWK_DOVE, x0_values=[0.2, 0.8], color=False)
+        assert "from 2 initial conditions" in plot
+        assert plot.endswith("* x0=0.2  + x0=0.8")
+
 
 class TestRenderAnalysis:
     def test_full_output(self):
@@ -29,9 +60,26 @@ class TestRenderAnalysis:
         output = render_analysis(HAWK_DOVE, color=True)
         assert len(output) > 0
 
+    def test_no_color_has_no_escapes(self):
+        assert "\033[" not in render_analysis(HAWK_DOVE, color=False)
+
+    def test_cache_keeps_signed_zero(self):
+        render_analysis(PayoffMatrix(0.0, 1, 2, 3), color=False)
+        output = render_analysis(PayoffMatrix(-0.0, 1, 2, 3), color=False)
+        assert "-0.0" in output
+
+    def test_cached_per_game_and_color(self):
+        plain = render_analysis(HAWK_DOVE, color=False)
+        assert render_analysis(HAWK_DOVE, color=False) is plain
+        assert render_analysis(HAWK_DOVE, color=True) != plain
+
 
 class TestRenderPayoffTable:
     def test_values_present(self):
         table = render_payoff_table(PRISONERS_DILEMMA, color=False)
         assert "3.0" in table
         assert "5.0" in table
+
+    def test_cache_keeps_signed_zero(self):
+        render_payoff_table(PayoffMatrix(0.0, 1, 2, 3), color=False)
+        assert "-0.0" in render_payoff_table(PayoffMatrix(-0.0, 1, 2, 3), color=False)